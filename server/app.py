@@ -1,24 +1,62 @@
-from flask import Flask, jsonify, request
-from flask_migrate import Migrate
+from flask import Blueprint, Flask, jsonify, request
 from server.models import db
 from flask_restful import Api, Resource
 from server.models import Airline, Flight, Passenger, Booking, Seat
 from datetime import datetime
 from flask_cors import CORS
+from sqlalchemy import update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import configure_mappers
+from sqlalchemy.orm.exc import StaleDataError
+import click
 import os
 
-app = Flask(__name__)
+api_bp = Blueprint("api", __name__)
+api = Api(api_bp)
 
-app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URI')
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
-CORS(app)
+def create_app(config=None):
+    app = Flask(__name__)
 
-migrate = Migrate(app, db)
+    app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URI')
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    if config:
+        app.config.from_mapping(config)
 
-db.init_app(app)
+    CORS(app)
 
-api = Api(app)
+    db.init_app(app)
+
+    # Flask-Migrate pulls in alembic, which only the `flask db` commands
+    # need. Skip it when the app is built outside the Flask CLI (gunicorn,
+    # seed.py) so workers boot faster.
+    if click.get_current_context(silent=True) is not None:
+        from flask_migrate import Migrate
+        Migrate(app, db)
+
+    app.register_blueprint(api_bp)
+
+    return app
+
+
+def warm_up(app):
+    """Do one-off startup work before serving requests.
+
+    Configures the mappers, opens a pooled connection and runs the
+    primary-key lookups once so SQLAlchemy's compiled-statement cache is
+    already populated. Under gunicorn --preload this runs once in the
+    master and is inherited by every worker.
+    """
+    configure_mappers()
+    with app.app_context():
+        try:
+            for model in (Airline, Flight, Passenger, Booking, Seat):
+                db.session.get(model, 0)
+        except SQLAlchemyError as e:
+            # A fresh database without tables should not stop the app booting.
+            app.logger.warning("Startup warm-up skipped: %s", e)
+        finally:
+            db.session.remove()
 
 def convert_to_datetime(date_str):
     try:
@@ -27,6 +65,99 @@ def convert_to_datetime(date_str):
         return None
 
 
+# Optimistic concurrency: every model carries a `version` column that is
+# bumped on each write. Detail GETs expose it as an ETag, and PUT/DELETE
+# honour If-Match so concurrent editors get a 412 instead of silently
+# overwriting each other.
+def make_etag(obj):
+    return f'"{obj.version}"'
+
+
+def if_match_versions():
+    """Return the versions listed in If-Match, or None if the header is absent or '*'.
+
+    If-Match uses strong comparison, so weak (W/) or malformed tags are
+    dropped and can never match.
+    """
+    header = request.headers.get("If-Match")
+    if not header or header.strip() == "*":
+        return None
+    versions = []
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            continue
+        try:
+            versions.append(int(tag.strip('"')))
+        except ValueError:
+            continue
+    return versions
+
+
+def get_detail(model, id, name, serialize):
+    obj = db.session.get(model, id)
+    if not obj:
+        return {"error": f"{name} not found"}, 404
+
+    # If-None-Match uses weak comparison, so W/ prefixes are ignored.
+    etag = make_etag(obj)
+    header = request.headers.get("If-None-Match", "")
+    tags = [tag.strip() for tag in header.split(",")]
+    tags = [tag[2:] if tag.startswith("W/") else tag for tag in tags]
+    if header.strip() == "*" or etag in tags:
+        return "", 304, {"ETag": etag}
+    return serialize(obj), 200, {"ETag": etag}
+
+
+def conditional_update(model, id, name, values):
+    """Apply `values` with a single UPDATE ... WHERE id=? [AND version IN (...)].
+
+    Returns (body, status, headers) ready to hand back from a resource.
+    """
+    if not values:
+        return {"error": "No updatable fields provided"}, 400
+
+    expected = if_match_versions()
+    stmt = update(model).where(model.id == id)
+    if expected is not None:
+        stmt = stmt.where(model.version.in_(expected))
+    stmt = (
+        stmt.values(version=model.version + 1, **values)
+        .returning(model.version)
+        .execution_options(synchronize_session=False)
+    )
+
+    new_version = db.session.execute(stmt).scalar_one_or_none()
+    if new_version is None:
+        db.session.rollback()
+        if expected is not None and db.session.get(model, id):
+            return {"error": f"{name} has been modified by another request"}, 412
+        return {"error": f"{name} not found"}, 404
+
+    db.session.commit()
+    return {"message": f"{name} updated", "id": id}, 200, {"ETag": f'"{new_version}"'}
+
+
+def conditional_delete(model, id, name):
+    obj = db.session.get(model, id)
+    if not obj:
+        return {"error": f"{name} not found"}, 404
+
+    expected = if_match_versions()
+    if expected is not None and obj.version not in expected:
+        return {"error": f"{name} has been modified by another request"}, 412
+
+    # The ORM delete keeps relationship cascades and is itself guarded by
+    # the mapper's version_id_col (DELETE ... WHERE id=? AND version=?).
+    try:
+        db.session.delete(obj)
+        db.session.commit()
+    except StaleDataError:
+        db.session.rollback()
+        return {"error": f"{name} has been modified by another request"}, 412
+    return {"message": f"{name} deleted"}, 200
+
+
 # Flask-RESTful Resources
 class HomeResource(Resource):
     def get(self):
@@ -36,12 +167,16 @@ api.add_resource(HomeResource, "/")
 
 
 class AirlineResource(Resource):
-    def get(self):
+    @staticmethod
+    def serialize(airline):
+        return {"id": airline.id, "name": airline.name, "country": airline.country}
+
+    def get(self, id=None):
+        if id is not None:
+            return get_detail(Airline, id, "Airline", self.serialize)
+
         airlines = Airline.query.all()
-        return [
-            {"id": airline.id, "name": airline.name, "country": airline.country}
-            for airline in airlines
-        ], 200
+        return [self.serialize(airline) for airline in airlines], 200
 
     def post(self):
         data = request.get_json()  
@@ -60,44 +195,34 @@ class AirlineResource(Resource):
         }, 201 
 
     def put(self, id):
-        airline = Airline.query.get(id)
-        if not airline:
-            return {"error": "Airline not found"}, 404
-
         data = request.get_json()
-        for field in ["name", "country"]:
-            if field in data:
-                setattr(airline, field, data[field])
-
-        db.session.commit()
-        return {"message": "Airline updated", "id": airline.id}, 200
+        values = {field: data[field] for field in ["name", "country"] if field in data}
+        return conditional_update(Airline, id, "Airline", values)
 
     def delete(self, id):
-        airline = Airline.query.get(id)
-        if not airline:
-            return {"error": "Airline not found"}, 404
-
-        db.session.delete(airline)
-        db.session.commit()
-        return {"message": "Airline deleted"}, 200
+        return conditional_delete(Airline, id, "Airline")
 
 api.add_resource(AirlineResource, "/airlines", "/airlines/<int:id>")
 
 
 class FlightResource(Resource):
-    def get(self):
+    @staticmethod
+    def serialize(flight):
+        return {
+            "id": flight.id,
+            "airline_id": flight.airline_id,
+            "departure_time": flight.departure_time.strftime('%Y-%m-%dT%H:%M:%S') if flight.departure_time else None,
+            "arrival_time": flight.arrival_time.strftime('%Y-%m-%dT%H:%M:%S') if flight.arrival_time else None,
+            "origin": flight.origin,
+            "destination": flight.destination,
+        }
+
+    def get(self, id=None):
+        if id is not None:
+            return get_detail(Flight, id, "Flight", self.serialize)
+
         flights = Flight.query.all()
-        return [
-            {
-                "id": flight.id,
-                "airline_id": flight.airline_id,
-                "departure_time": flight.departure_time.strftime('%Y-%m-%dT%H:%M:%S') if flight.departure_time else None,
-                "arrival_time": flight.arrival_time.strftime('%Y-%m-%dT%H:%M:%S') if flight.arrival_time else None,
-                "origin": flight.origin,
-                "destination": flight.destination,
-            }
-            for flight in flights
-        ], 200
+        return [self.serialize(flight) for flight in flights], 200
 
     def post(self):
         data = request.get_json()
@@ -138,10 +263,6 @@ class FlightResource(Resource):
         }, 201
 
     def put(self, id):
-        flight = Flight.query.get(id)
-        if not flight:
-            return {"error": "Flight not found"}, 404
-
         data = request.get_json()
         
         if 'departure_time' in data:
@@ -149,33 +270,28 @@ class FlightResource(Resource):
         if 'arrival_time' in data:
             data['arrival_time'] = convert_to_datetime(data['arrival_time']) if isinstance(data['arrival_time'], str) else data['arrival_time']
 
-        for field in ["airline_id", "departure_time", "arrival_time", "origin", "destination"]:
-            if field in data:
-                setattr(flight, field, data[field])
-
-        db.session.commit()
-        return {"message": "Flight updated", "id": flight.id}, 200
+        fields = ["airline_id", "departure_time", "arrival_time", "origin", "destination"]
+        values = {field: data[field] for field in fields if field in data}
+        return conditional_update(Flight, id, "Flight", values)
 
     def delete(self, id):
-        flight = Flight.query.get(id)
-        if not flight:
-            return {"error": "Flight not found"}, 404
-
-        db.session.delete(flight)
-        db.session.commit()
-        return {"message": "Flight deleted"}, 200
+        return conditional_delete(Flight, id, "Flight")
 
     
 api.add_resource(FlightResource, "/flights", "/flights/<int:id>")
 
 
 class PassengerResource(Resource):
-    def get(self):
+    @staticmethod
+    def serialize(p):
+        return {"id": p.id, "name": p.name, "email": p.email}
+
+    def get(self, id=None):
+        if id is not None:
+            return get_detail(Passenger, id, "Passenger", self.serialize)
+
         passengers = Passenger.query.all()
-        return [
-            {"id": p.id, "name": p.name, "email": p.email}
-            for p in passengers
-        ], 200
+        return [self.serialize(p) for p in passengers], 200
 
     def post(self):
         data = request.get_json()
@@ -194,41 +310,31 @@ class PassengerResource(Resource):
         }, 201
 
     def put(self, id):
-        passenger = Passenger.query.get(id)
-        if not passenger:
-            return {"error": "Passenger not found"}, 404
-
         data = request.get_json()
-        for field in ["name", "email"]:
-            if field in data:
-                setattr(passenger, field, data[field])
-
-        db.session.commit()
-        return {"message": "Passenger updated", "id": passenger.id}, 200
+        values = {field: data[field] for field in ["name", "email"] if field in data}
+        return conditional_update(Passenger, id, "Passenger", values)
 
     def delete(self, id):
-        passenger = Passenger.query.get(id)
-        if not passenger:
-            return {"error": "Passenger not found"}, 404
-
-        db.session.delete(passenger)
-        db.session.commit()
-        return {"message": "Passenger deleted"}, 200
+        return conditional_delete(Passenger, id, "Passenger")
 
 api.add_resource(PassengerResource, "/passengers", "/passengers/<int:id>")
 
 
 class BookingResource(Resource):
-    def get(self):
+    @staticmethod
+    def serialize(b):
+        return {
+            "id": b.id,
+            "passenger_id": b.passenger_id,
+            "booking_date": b.booking_date.strftime('%Y-%m-%dT%H:%M:%S') if b.booking_date else None
+        }
+
+    def get(self, id=None):
+        if id is not None:
+            return get_detail(Booking, id, "Booking", self.serialize)
+
         bookings = Booking.query.all()
-        return [
-            {
-                "id": b.id,
-                "passenger_id": b.passenger_id,
-                "booking_date": b.booking_date.strftime('%Y-%m-%dT%H:%M:%S') if b.booking_date else None
-            }
-            for b in bookings
-        ], 200
+        return [self.serialize(b) for b in bookings], 200
 
     def post(self):
         data = request.get_json()
@@ -254,47 +360,37 @@ class BookingResource(Resource):
         }, 201
 
     def put(self, id):
-        booking = Booking.query.get(id)
-        if not booking:
-            return {"error": "Booking not found"}, 404
-
         data = request.get_json()
         if 'booking_date' in data:
             data['booking_date'] = convert_to_datetime(data['booking_date']) if isinstance(data['booking_date'], str) else data['booking_date']
 
-        for field in ["passenger_id", "booking_date"]:
-            if field in data:
-                setattr(booking, field, data[field])
-
-        db.session.commit()
-        return {"message": "Booking updated", "id": booking.id}, 200
+        values = {field: data[field] for field in ["passenger_id", "booking_date"] if field in data}
+        return conditional_update(Booking, id, "Booking", values)
 
     def delete(self, id):
-        booking = Booking.query.get(id)
-        if not booking:
-            return {"error": "Booking not found"}, 404
-
-        db.session.delete(booking)
-        db.session.commit()
-        return {"message": "Booking deleted"}, 200
+        return conditional_delete(Booking, id, "Booking")
     
 
 api.add_resource(BookingResource, "/bookings", "/bookings/<int:id>")
 
 
 class SeatResource(Resource):
-    def get(self):
+    @staticmethod
+    def serialize(seat):
+        return {
+            "id": seat.id,
+            "flight_id": seat.flight_id,
+            "seat_number": seat.seat_number,
+            "is_booked": seat.is_booked,
+            "booking_id": seat.booking_id,
+        }
+
+    def get(self, id=None):
+        if id is not None:
+            return get_detail(Seat, id, "Seat", self.serialize)
+
         seats = Seat.query.all()
-        return [
-            {
-                "id": seat.id,
-                "flight_id": seat.flight_id,
-                "seat_number": seat.seat_number,
-                "is_booked": seat.is_booked,
-                "booking_id": seat.booking_id,
-            }
-            for seat in seats
-        ], 200
+        return [self.serialize(seat) for seat in seats], 200
 
     def post(self):
         data = request.get_json()
@@ -317,29 +413,16 @@ class SeatResource(Resource):
         }, 201
 
     def put(self, id):
-        seat = Seat.query.get(id)
-        if not seat:
-            return {"error": "Seat not found"}, 404
-
         data = request.get_json()
-        for field in ["flight_id", "seat_number", "is_booked", "booking_id"]:
-            if field in data:
-                setattr(seat, field, data[field])
-
-        db.session.commit()
-        return {"message": "Seat updated", "id": seat.id}, 200
+        fields = ["flight_id", "seat_number", "is_booked", "booking_id"]
+        values = {field: data[field] for field in fields if field in data}
+        return conditional_update(Seat, id, "Seat", values)
 
     def delete(self, id):
-        seat = Seat.query.get(id)
-        if not seat:
-            return {"error": "Seat not found"}, 404
-
-        db.session.delete(seat)
-        db.session.commit()
-        return {"message": "Seat deleted"}, 200
+        return conditional_delete(Seat, id, "Seat")
     
-api.add_resource(SeatResource, "/seats")
+api.add_resource(SeatResource, "/seats", "/seats/<int:id>")
 
 
 if __name__ == '__main__':
-    app.run(debug=True, port=5555)
\ No newline at end of file
+    create_app().run(debug=True, port=5555)
\ No newline at end of file
@@ -0,0 +1,16 @@
+# Run with: gunicorn -c server/gunicorn.conf.py
+wsgi_app = "server.wsgi:app"
+
+# Import and warm the app once in the master; workers share it via fork.
+preload_app = True
+
+
+def post_fork(server, worker):
+    # Connections opened in the master during warm-up must not be shared
+    # across processes. Give each worker a fresh pool without closing the
+    # parent's sockets.
+    from server.models import db
+    from server.wsgi import app
+
+    with app.app_context():
+        db.engine.dispose(close=False)
@@ -0,0 +1,31 @@
+"""Add version columns
+
+Revision ID: 3f1c9b2e7a41
+Revises: da722d863a3e
+Create Date: 2026-10-19 09:12:31.204518
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1c9b2e7a41'
+down_revision = 'da722d863a3e'
+branch_labels = None
+depends_on = None
+
+
+TABLES = ['airline', 'passenger', 'booking', 'flights', 'seat']
+
+
+def upgrade():
+    for table in TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.add_column(sa.Column('version', sa.Integer(), nullable=False, server_default='1'))
+
+
+def downgrade():
+    for table in reversed(TABLES):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column('version')
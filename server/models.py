@@ -17,9 +17,12 @@ class Airline(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
     country = db.Column(db.String(50), nullable=False)
+    version = db.Column(db.Integer, nullable=False, default=1)
 
     flights = db.relationship('Flight', back_populates='airline', lazy=True, cascade="all, delete-orphan")
 
+    __mapper_args__ = {"version_id_col": version}
+
     serialize_rules = ("-flights.airline",)
 
     # def __repr__(self):
@@ -36,10 +39,13 @@ class Flight(db.Model):
     arrival_time = db.Column(db.DateTime, nullable=False)
     origin = db.Column(db.String(50), nullable=False)
     destination = db.Column(db.String(50), nullable=False)
+    version = db.Column(db.Integer, nullable=False, default=1)
 
     seat = db.relationship('Seat', back_populates='flights', lazy=True, cascade="all, delete-orphan")
     airline = db.relationship('Airline', back_populates='flights', lazy=True)
 
+    __mapper_args__ = {"version_id_col": version}
+
     serialize_rules = ("-seat.flights", "-airline.flights")
 
     # def __repr__(self):
@@ -52,9 +58,12 @@ class Passenger(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
     email = db.Column(db.String(100), nullable=False, unique=True)
+    version = db.Column(db.Integer, nullable=False, default=1)
 
     bookings = db.relationship('Booking', back_populates='passenger', lazy=True)
 
+    __mapper_args__ = {"version_id_col": version}
+
     serialize_rules = ("-bookings.passenger",)
 
     # def __repr__(self):
@@ -67,10 +76,13 @@ class Booking(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     passenger_id = db.Column(db.Integer, db.ForeignKey('passenger.id'), nullable=False)
     booking_date = db.Column(db.DateTime, nullable=False, default=datetime.now)
+    version = db.Column(db.Integer, nullable=False, default=1)
 
     seat = db.relationship('Seat', back_populates='booking', uselist=False)  # One-to-one relationship with Seat
     passenger = db.relationship('Passenger', back_populates='bookings', lazy=True)
 
+    __mapper_args__ = {"version_id_col": version}
+
     serialize_rules = ("-seat.booking", "-passenger.bookings")
 
     # def __repr__(self):
@@ -86,9 +98,13 @@ class Seat(db.Model):
     is_booked = db.Column(db.Boolean, default=False)
     booking_id = db.Column(db.Integer, db.ForeignKey('booking.id'), unique=True, nullable=True)
     
+    version = db.Column(db.Integer, nullable=False, default=1)
+
     flights = db.relationship('Flight', back_populates='seat', lazy=True)      
     booking = db.relationship('Booking', back_populates='seat', uselist=False)  # One-to-one relationship with Booking
 
+    __mapper_args__ = {"version_id_col": version}
+
     serialize_rules = ("-flights.seat", "-booking.seat")
 
     # def __repr__(self):
@@ -1,5 +1,5 @@
 from server.models import db, Airline, Flight, Passenger, Booking, Seat
-from app import app
+from server.app import create_app
 from datetime import datetime, timedelta
 
 # Clear existing data 
@@ -58,6 +58,7 @@ def seed_database():
     print("Database seeded successfully!")
 
 if __name__ == "__main__":
+    app = create_app()
     with app.app_context():
         print("Clearing database...")
         clear_database()
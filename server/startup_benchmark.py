@@ -0,0 +1,85 @@
+"""Measure how long it takes a fresh interpreter to boot the app.
+
+Run from the repository root:
+
+    python -m server.startup_benchmark [runs]
+
+Each run starts a new Python process that imports server.wsgi (what a
+gunicorn worker loads), so the numbers include every import and the
+startup warm-up. The heaviest imports are listed from `-X importtime`.
+
+DATABASE_URI defaults to the bundled server/airlines.db so warm-up runs
+against real tables. The warm-up only reads, so the database is left as is.
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+TARGET = "server.wsgi"
+DEFAULT_DATABASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "airlines.db")
+# Modules that should never be imported when serving requests.
+CLI_ONLY = ("flask_migrate", "alembic")
+WARM_UP_SKIPPED = "Startup warm-up skipped"
+
+
+def time_boot():
+    """Return (seconds, skip_reason) for one cold import of TARGET.
+
+    skip_reason is the warm-up warning logged by the app, or None if the
+    warm-up ran.
+    """
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", f"import {TARGET}"],
+        check=True, stderr=subprocess.PIPE, text=True,
+    )
+    elapsed = time.perf_counter() - start
+    skipped = [line for line in result.stderr.splitlines() if WARM_UP_SKIPPED in line]
+    return elapsed, skipped[0] if skipped else None
+
+
+def import_costs():
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {TARGET}"],
+        check=True, capture_output=True, text=True,
+    )
+    costs = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        costs[name.strip()] = int(cumulative)
+    return costs
+
+
+def main(runs=10):
+    os.environ.setdefault("DATABASE_URI", f"sqlite:///{DEFAULT_DATABASE}")
+
+    boots = [time_boot() for _ in range(runs)]
+    times = [elapsed for elapsed, _ in boots]
+    print(f"Boot time over {runs} runs: "
+          f"median {statistics.median(times) * 1000:.1f} ms, "
+          f"min {min(times) * 1000:.1f} ms, max {max(times) * 1000:.1f} ms")
+    skipped = [reason for _, reason in boots if reason]
+    if skipped:
+        print(f"Note: warm-up was skipped in {len(skipped)} of {runs} runs, "
+              f"so these times leave out its cost. Check that DATABASE_URI "
+              f"points at a migrated database.\n  {skipped[0]}")
+
+    costs = import_costs()
+    top_level = {name: us for name, us in costs.items() if "." not in name}
+    print("\nSlowest top-level imports (cumulative):")
+    for name, us in sorted(top_level.items(), key=lambda item: item[1], reverse=True)[:10]:
+        print(f"  {us / 1000:8.1f} ms  {name}")
+
+    loaded = [name for name in CLI_ONLY if name in costs]
+    if loaded:
+        print(f"\nCLI-only modules imported at boot: {', '.join(loaded)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 10))
@@ -0,0 +1,4 @@
+from server.app import create_app, warm_up
+
+app = create_app()
+warm_up(app)